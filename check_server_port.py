@@ -1,18 +1,197 @@
 #!/usr/bin/env python3
 
 import argparse
+import functools
 import json
 import os
+import re
+import select
 import socket
 import subprocess
 import sys
+import time
 import signal
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Set
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Short-lived cache of port -> (timestamp, conflicts) so the common
+# "check, then verify" pattern doesn't fork lsof twice for the same port.
+# Entries are dropped explicitly after we signal a process.
+_port_cache: Dict[int, Tuple[float, List[Tuple[int, str]]]] = {}
+_PORT_CACHE_TTL = 2.0
+
+# Leading "COMMAND PID" columns of lsof's columnar output; compiled once,
+# and matched against bytes so the whole buffer never gets decoded
+_LSOF_PROC_RE = re.compile(rb'^(\S+)\s+(\d+)', re.MULTILINE)
+
+
+def _check_output_retry(cmd, **kwargs):
+    """Run subprocess.check_output, retrying if a signal interrupts the
+    wait (EINTR) so a stray signal doesn't abort the port check"""
+    while True:
+        try:
+            return subprocess.check_output(cmd, **kwargs)
+        except InterruptedError:
+            continue
+
+
+def check_ports_in_use(ports: Set[int]) -> Dict[int, List[Tuple[int, str]]]:
+    """Probe all ports with a single lsof invocation and return a mapping of
+    each in-use port to the (pid, name) tuples of the processes using it.
+
+    lsof accepts comma-separated port lists, so checking N ports costs one
+    fork instead of N. The -F field output (one datum per line, prefixed
+    with p/c/n) is also cheaper to parse than the columnar format.
+    """
+    conflicts_by_port: Dict[int, List[Tuple[int, str]]] = {}
+    port_arg = "-iTCP:" + ",".join(str(p) for p in sorted(ports))
+    try:
+        output = _check_output_retry(
+            ["lsof", "-nP", "-sTCP:LISTEN", "-F", "pcn", port_arg],
+            stderr=subprocess.STDOUT,
+            text=True,
+            timeout=2.0
+        )
+    except subprocess.CalledProcessError:
+        # lsof didn't find anything or command failed
+        return conflicts_by_port
+    except subprocess.TimeoutExpired:
+        # A wedged lsof (classically: a stuck NFS mount in some process's
+        # fd table) must not hang the whole check indefinitely
+        print("Warning: lsof timed out; skipping conflict detection", file=sys.stderr)
+        return conflicts_by_port
+
+    pid = None
+    name = None
+    for line in output.splitlines():
+        if not line:
+            continue
+        tag, value = line[0], line[1:]
+        if tag == 'p':
+            try:
+                pid = int(value)
+            except ValueError:
+                pid = None
+        elif tag == 'c':
+            name = value
+        elif tag == 'n' and pid is not None:
+            # Name field looks like "127.0.0.1:3000" or "*:3000"
+            try:
+                port = int(value.rsplit(':', 1)[1])
+            except (IndexError, ValueError):
+                continue
+            if port in ports:
+                entry = (pid, name or "unknown")
+                bucket = conflicts_by_port.setdefault(port, [])
+                if entry not in bucket:
+                    bucket.append(entry)
+    return conflicts_by_port
+
+
+def _find_port_users_linux(port: int) -> List[Tuple[int, str]]:
+    """Identify processes listening on a port by parsing /proc directly.
+
+    On Linux, reading /proc/net/tcp and /proc/net/tcp6 and mapping the
+    socket inode back to a PID via /proc/<pid>/fd is a pure-Python scan
+    with no subprocess fork, far cheaper than shelling out to lsof.
+    """
+    inodes = set()
+    for path in ("/proc/net/tcp", "/proc/net/tcp6"):
+        # Read raw bytes with os.read rather than a buffered text file:
+        # splitting and field-matching stay at the C level and the hex
+        # fields never pay for unicode decoding. On a busy box these
+        # tables run to thousands of rows.
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            chunks = []
+            while True:
+                chunk = os.read(fd, 1 << 20)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        finally:
+            os.close(fd)
+        data = b"".join(chunks)
+        for line in data.splitlines()[1:]:
+            parts = line.split()
+            # Field 3 is the socket state; 0A == LISTEN
+            if len(parts) < 10 or parts[3] != b"0A":
+                continue
+            try:
+                local_port = int(parts[1].split(b':')[1], 16)
+            except (IndexError, ValueError):
+                continue
+            if local_port == port:
+                inodes.add(parts[9].decode())
+
+    conflicts = []
+    if not inodes:
+        return conflicts
+
+    targets = {f"socket:[{inode}]" for inode in inodes}
+    for entry in os.scandir("/proc"):
+        if not entry.name.isdigit():
+            continue
+        pid = int(entry.name)
+        try:
+            fds = os.listdir(f"/proc/{pid}/fd")
+        except OSError:
+            # Process exited or we lack permission; skip it
+            continue
+        for fd in fds:
+            try:
+                target = os.readlink(f"/proc/{pid}/fd/{fd}")
+            except OSError:
+                continue
+            if target in targets:
+                try:
+                    with open(f"/proc/{pid}/comm") as f:
+                        name = f.read().strip()
+                except OSError:
+                    name = "unknown"
+                conflicts.append((pid, name))
+                break
+    return conflicts
+
+
+def is_port_free(port: int) -> bool:
+    """Cheap yes/no bind probe for callers that don't need the PID list.
+
+    A bind syscall costs microseconds versus the fork+exec of an lsof
+    scan, so verification sweeps after a kill should use this first and
+    only fall back to the full probe when the port is still occupied.
+    """
+    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    try:
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        s.bind(("127.0.0.1", port))
+        return True
+    except OSError:
+        return False
+    finally:
+        s.close()
+
+
+def _invalidate_port_cache(port: int):
+    """Drop the cached probe result for a port (call after killing processes)"""
+    _port_cache.pop(port, None)
+
 
 def check_port_in_use(port: int) -> List[Tuple[int, str]]:
     """Check if a port is already in use and return a list of (pid, name) tuples of conflicting processes"""
+    cached = _port_cache.get(port)
+    if cached is not None and time.monotonic() - cached[0] < _PORT_CACHE_TTL:
+        return cached[1]
+
     conflicts = []
-    
+
     # Create a socket to test if the port is in use
     s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
     try:
@@ -26,58 +205,122 @@ def check_port_in_use(port: int) -> List[Tuple[int, str]]:
         # Port is free
     except socket.error:
         # Port is in use, find which process is using it
-        try:
-            # On macOS, use lsof to find processes using the port
-            output = subprocess.check_output(
-                ["lsof", "-i", f":{port}"], 
-                stderr=subprocess.STDOUT,
-                text=True
-            )
-            
-            # Parse lsof output (skip header line)
-            for line in output.strip().split('\n')[1:]:
-                parts = line.split()
-                if len(parts) >= 2:
-                    process_name = parts[0]
-                    pid = parts[1]
-                    try:
-                        pid = int(pid)
-                        conflicts.append((pid, process_name))
-                    except ValueError:
-                        # Skip if pid isn't numeric
-                        pass
-        except subprocess.CalledProcessError:
-            # lsof didn't find anything or command failed
-            pass
+        if sys.platform.startswith("linux"):
+            # On Linux, walk /proc instead of forking lsof
+            conflicts = _find_port_users_linux(port)
+        else:
+            try:
+                # On macOS, use lsof to find processes using the port
+                output = _check_output_retry(
+                    ["lsof", "-nP", "-i", f":{port}"],
+                    stderr=subprocess.STDOUT,
+                    timeout=2.0
+                )
+
+                # One precompiled multiline pass over the raw bytes
+                # replaces a strip/split per row (and the header row
+                # self-excludes: its PID column isn't numeric)
+                for match in _LSOF_PROC_RE.finditer(output):
+                    conflicts.append((int(match.group(2)), match.group(1).decode()))
+            except subprocess.CalledProcessError:
+                # lsof didn't find anything or command failed
+                pass
+            except subprocess.TimeoutExpired:
+                print("Warning: lsof timed out; skipping conflict detection", file=sys.stderr)
     finally:
-        # Make sure to close the socket and clean up properly
-        try:
-            s.shutdown(socket.SHUT_RDWR)
-        except (socket.error, OSError):
-            # Socket might not be connected, ignore
-            pass
+        # The probe socket is never connected, so a shutdown() here would
+        # only raise ENOTCONN; SO_REUSEADDR already covers TIME_WAIT reuse
         s.close()
-    
+
+    _port_cache[port] = (time.monotonic(), conflicts)
     return conflicts
 
-def get_server_port(config_file: str, server_name: str) -> Optional[int]:
-    """Get the port for a specific server by name"""
+@functools.lru_cache(maxsize=8)
+def _parse_config(config_file: str, mtime_ns: int) -> Dict:
+    """Parse the config file; cached on (path, mtime) so repeated calls
+    while the file is unchanged cost a stat() instead of a full re-parse"""
+    with open(config_file, 'rb') as f:
+        data = f.read()
+    # Prefer orjson's native-code parser when it's installed
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _load_config(config_file: str) -> Dict:
     try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-            
-            for server in config.get("servers", []):
-                if server.get("name") == server_name:
-                    port = server.get("port")
-                    if port is not None and isinstance(port, int):
-                        return port
-            
-            print(f"Error: Server '{server_name}' not found in config or has no port defined")
-            return None
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        mtime_ns = os.stat(config_file).st_mtime_ns
+        return _parse_config(config_file, mtime_ns)
+    except (FileNotFoundError, ValueError) as e:
         print(f"Error loading config file: {e}")
         sys.exit(1)
 
+
+def load_server_ports(config_file: str) -> Dict[str, int]:
+    """Build a name -> port map for every configured server in one pass.
+
+    Callers that need both a specific server's port and the full port set
+    share this single (cached) parse instead of re-walking the config.
+    """
+    config = _load_config(config_file)
+    return {
+        server["name"]: server["port"]
+        for server in config.get("servers", [])
+        if server.get("name") and isinstance(server.get("port"), int)
+    }
+
+
+def get_server_port(config_file: str, server_name: str) -> Optional[int]:
+    """Get the port for a specific server by name"""
+    port = load_server_ports(config_file).get(server_name)
+    if port is None:
+        print(f"Error: Server '{server_name}' not found in config or has no port defined")
+    return port
+
+def _wait_for_pids_exit(pids: List[int], timeout: float):
+    """Wait for the given PIDs to exit, for at most timeout seconds.
+
+    On Linux >= 5.3 each PID is opened as a pidfd and polled, so we wake
+    as soon as the processes actually exit (often milliseconds after
+    SIGTERM) instead of always sleeping the full grace period. Falls back
+    to a plain sleep where pidfd_open is unavailable.
+    """
+    if not pids:
+        return
+    if not hasattr(os, "pidfd_open"):
+        time.sleep(timeout)
+        return
+
+    poller = select.poll()
+    fds = {}
+    try:
+        for pid in pids:
+            try:
+                fd = os.pidfd_open(pid)
+            except ProcessLookupError:
+                # Already exited
+                continue
+            except OSError:
+                # Kernel without pidfd support; fall back to sleeping
+                time.sleep(timeout)
+                return
+            poller.register(fd, select.POLLIN)
+            fds[fd] = pid
+
+        deadline = time.monotonic() + timeout
+        while fds:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            for fd, _ in poller.poll(int(remaining * 1000) + 1):
+                poller.unregister(fd)
+                os.close(fd)
+                del fds[fd]
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+
 def check_server_port(port: int, kill_conflicts: bool = False, force: bool = False) -> bool:
     """Check if a server port is in use and optionally kill the conflicting processes
     
@@ -86,9 +329,10 @@ def check_server_port(port: int, kill_conflicts: bool = False, force: bool = Fal
         kill_conflicts: Whether to attempt to kill conflicting processes
         force: If true, use more aggressive termination with shorter wait times
     """
-    if port is None:
+    # Reject missing or out-of-range ports before paying for a probe
+    if not isinstance(port, int) or not (0 < port < 65536):
         return False
-        
+
     port_name = f"Server port {port}"
     conflicts = check_port_in_use(port)
     
@@ -108,6 +352,8 @@ def check_server_port(port: int, kill_conflicts: bool = False, force: bool = Fal
                     print(f"  - Sending SIGTERM to PID {pid} ({name})")
                     os.kill(pid, signal.SIGTERM)
                     killed_pids.append(pid)
+                    # Force a fresh probe on the next check for this port
+                    _invalidate_port_cache(port)
                 except OSError as e:
                     print(f"    Error killing process {pid}: {e}")
                     has_conflicts = True
@@ -119,11 +365,11 @@ def check_server_port(port: int, kill_conflicts: bool = False, force: bool = Fal
     
     # If any processes were killed with SIGTERM, give them a moment to shut down
     if killed_pids:
-        import time
         # Use shorter wait time if force mode is enabled
         wait_time = 1.0 if force else 1.0
-        time.sleep(wait_time)
-        
+        # Wakes early once the processes actually exit
+        _wait_for_pids_exit(killed_pids, wait_time)
+
         # If we're in force mode, try to kill any remaining processes with SIGKILL
         if force:
             for pid in killed_pids:
@@ -143,7 +389,27 @@ def check_server_port(port: int, kill_conflicts: bool = False, force: bool = Fal
     # Do a final check after killing processes
     if kill_conflicts:
         has_conflicts = False
-        if check_port_in_use(port):
+        # Cheap verification first: probe the PIDs we signalled with
+        # os.kill(pid, 0). If they are all gone, the port must be free and
+        # we can skip another socket-plus-lsof probe entirely.
+        still_alive = []
+        for pid in killed_pids:
+            try:
+                os.kill(pid, 0)
+                still_alive.append(pid)
+            except ProcessLookupError:
+                # Process is dead, as intended
+                pass
+            except PermissionError:
+                # Process exists but belongs to someone else
+                still_alive.append(pid)
+        if killed_pids and not still_alive and len(killed_pids) == len(conflicts):
+            # Every discovered conflict was signalled and has exited;
+            # no re-probe needed. If any os.kill failed above (e.g. a
+            # root-owned listener), the port may still be held, so fall
+            # through to the probe.
+            pass
+        elif not is_port_free(port):
             print(f"WARNING: {port_name} ({port}) is still in use after kill attempt.")
             has_conflicts = True
             
@@ -1,85 +1,176 @@
 #!/usr/bin/env python3
 
 import argparse
-import json
+import errno
 import os
+import signal
 import socket
-import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Set
 
+from check_server_port import (
+    _find_port_users_linux,
+    _wait_for_pids_exit,
+    check_ports_in_use,
+    is_port_free,
+    load_server_ports,
+)
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Cache PID -> process name lookups so repeated conflicts on the same
+# process don't re-query the OS
+_process_name_cache: Dict[int, str] = {}
+
+
+def _process_name(pid: int) -> str:
+    """Resolve a PID to a process name, memoizing the result"""
+    name = _process_name_cache.get(pid)
+    if name is None:
+        try:
+            name = psutil.Process(pid).name()
+        except psutil.Error:
+            name = "unknown"
+        _process_name_cache[pid] = name
+    return name
+
+
+def scan_listening_ports(ports: Set[int]) -> Dict[int, List[Tuple[int, str]]]:
+    """Enumerate all listening sockets in one pass and return a mapping of
+    each configured port to the (pid, name) tuples using it.
+
+    This replaces N per-port probes (each a socket bind plus an lsof fork)
+    with a single system-wide enumeration via psutil.
+    """
+    conflicts_by_port: Dict[int, List[Tuple[int, str]]] = {}
+    for conn in psutil.net_connections(kind="inet"):
+        if conn.status != psutil.CONN_LISTEN:
+            continue
+        port = conn.laddr.port
+        if port in ports and conn.pid is not None:
+            conflicts_by_port.setdefault(port, []).append((conn.pid, _process_name(conn.pid)))
+    return conflicts_by_port
+
+
+def check_ports_parallel(ports: Set[int]) -> Dict[int, List[Tuple[int, str]]]:
+    """Probe each port concurrently with a thread pool.
+
+    The per-port probes are I/O-bound (socket syscalls plus, off-Linux, a
+    subprocess wait), so threads overlap them nearly linearly. Used when
+    neither psutil nor a batched lsof invocation is available.
+    """
+    port_list = sorted(ports)
+    with ThreadPoolExecutor(max_workers=min(32, len(port_list))) as executor:
+        return dict(zip(port_list, executor.map(check_port_in_use, port_list)))
+
+
+def _probe_port(port: int) -> int:
+    """Blocking connect_ex against loopback on a fresh socket.
+
+    Each probe gets its own socket: a reused non-blocking socket
+    delivers connect errors one probe late, so a stale ECONNREFUSED
+    could report an occupied port as free — and the thread-pool path
+    maps this function across many workers, so shared state would need
+    locking anyway. Loopback connects resolve in microseconds; the
+    short timeout is only a safety net."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
+        s.settimeout(0.5)
+        try:
+            return s.connect_ex(("127.0.0.1", port))
+        except socket.timeout:
+            return errno.ETIMEDOUT
+
+
 def check_port_in_use(port: int) -> List[Tuple[int, str]]:
     """Check if a port is already in use and return a list of (pid, name) tuples of conflicting processes"""
     conflicts = []
-    
-    # Create a socket to test if the port is in use
-    s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    try:
-        s.bind(("127.0.0.1", port))
-        # Port is free
-    except socket.error:
-        # Port is in use, find which process is using it
+
+    # Probe with a non-blocking connect rather than a bind: a refused
+    # connection proves nothing is listening without touching the kernel
+    # port allocator or leaving TIME_WAIT noise behind on repeated runs
+    err = _probe_port(port)
+
+    if err == errno.ECONNREFUSED:
+        # Nothing is listening; the port is free
+        return conflicts
+
+    # Connect succeeded (or is in progress), so something is listening;
+    # find which process is using the port
+    if sys.platform.startswith("linux"):
+        # On Linux, walk /proc instead of forking lsof
+        conflicts = _find_port_users_linux(port)
+    else:
         try:
-            # On macOS, use lsof to find processes using the port
-            output = subprocess.check_output(
-                ["lsof", "-i", f":{port}"], 
-                stderr=subprocess.STDOUT,
-                text=True
-            )
-            
-            # Parse lsof output (skip header line)
-            for line in output.strip().split('\n')[1:]:
-                parts = line.split()
-                if len(parts) >= 2:
-                    process_name = parts[0]
-                    pid = parts[1]
-                    try:
-                        pid = int(pid)
-                        conflicts.append((pid, process_name))
-                    except ValueError:
-                        # Skip if pid isn't numeric
-                        pass
-        except subprocess.CalledProcessError:
-            # lsof didn't find anything or command failed
+            # On macOS, use lsof in -F field mode (shared with the batch
+            # path); it emits one datum per line instead of columnar
+            # output that needs a split() per row
+            conflicts = check_ports_in_use({port}).get(port, [])
+        except FileNotFoundError:
+            # No lsof binary; report the port as in use without owners
             pass
-    finally:
-        s.close()
-    
+
     return conflicts
 
 def load_ports_from_config(config_file: str) -> Set[int]:
     """Load server ports from the config file"""
-    try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-            ports = set()
-            for server in config.get("servers", []):
-                port = server.get("port")
-                if port is not None and isinstance(port, int):
-                    ports.add(port)
-            return ports
-    except (FileNotFoundError, json.JSONDecodeError) as e:
-        print(f"Error loading config file: {e}")
-        sys.exit(1)
+    # Thin view over the shared (cached) name -> port map, so callers
+    # that use both helpers pay for one config parse
+    ports = set()
+    for port in load_server_ports(config_file).values():
+        # Filter out-of-range values here so a malformed config never
+        # reaches the probe path
+        if 0 < port < 65536:
+            ports.add(port)
+    return ports
 
 def check_ports(ports: Set[int], kill_conflicts: bool = False) -> bool:
     """Check if any of the required ports are in use"""
     ports_to_check = [(port, f"Server port {port}") for port in ports]
-    
+
     has_conflicts = False
     killed_pids = []
-    
+    killed_ports = set()
+
+    # Prefer a single enumeration of all listening sockets over per-port
+    # probes (each of which forks lsof); fall back if psutil is
+    # unavailable or not permitted to enumerate
+    conflicts_by_port = None
+    if psutil is not None:
+        try:
+            conflicts_by_port = scan_listening_ports(ports)
+        except psutil.Error:
+            # net_connections requires root on macOS (AccessDenied);
+            # use the lsof path below instead
+            pass
+    if conflicts_by_port is None:
+        try:
+            conflicts_by_port = check_ports_in_use(ports)
+        except FileNotFoundError:
+            # No lsof binary available; probe ports concurrently instead
+            conflicts_by_port = check_ports_parallel(ports)
+
     for port, port_name in ports_to_check:
-        conflicts = check_port_in_use(port)
+        conflicts = conflicts_by_port.get(port, [])
         if conflicts:
             if kill_conflicts:
                 print(f"Killing processes using {port_name} ({port}):")
                 for pid, name in conflicts:
                     try:
-                        # Send SIGTERM
+                        # Send SIGTERM to the whole process group so
+                        # wrapper-spawned children (npx -> node -> server)
+                        # go down with the listener we found, instead of
+                        # surviving to hold the port open
                         print(f"  - Sending SIGTERM to PID {pid} ({name})")
-                        os.kill(pid, 15)  # SIGTERM
+                        try:
+                            os.killpg(os.getpgid(pid), signal.SIGTERM)
+                        except OSError:
+                            os.kill(pid, signal.SIGTERM)
                         killed_pids.append(pid)
+                        killed_ports.add(port)
                     except OSError as e:
                         print(f"    Error killing process {pid}: {e}")
                         has_conflicts = True
@@ -89,17 +180,21 @@ def check_ports(ports: Set[int], kill_conflicts: bool = False) -> bool:
                     print(f"  - PID {pid}: {name}")
                 has_conflicts = True
     
-    # If any processes were killed with SIGTERM, give them a moment to shut down
+    # If any processes were killed with SIGTERM, wait for them to exit —
+    # but no longer than necessary: the wait returns as soon as the last
+    # PID disappears rather than sleeping out a fixed second
     if killed_pids:
-        import time
-        time.sleep(1)
+        _wait_for_pids_exit(killed_pids, 1.0)
     
-    # Do a final check after killing processes
+    # Do a final check after killing processes. Only the ports we
+    # actually signalled something on need re-checking — the rest were
+    # already reported free by the initial scan — and a yes/no bind
+    # probe per port replaces a second full enumeration.
     if kill_conflicts:
         has_conflicts = False
-        for port, port_name in ports_to_check:
-            if check_port_in_use(port):
-                print(f"WARNING: {port_name} ({port}) is still in use after kill attempt.")
+        for port in sorted(killed_ports):
+            if not is_port_free(port):
+                print(f"WARNING: Server port {port} is still in use after kill attempt.")
                 has_conflicts = True
                 
         if has_conflicts:
@@ -1,54 +1,156 @@
 #!/usr/bin/env python3
+import random
+import shlex
 import subprocess
 import sys
 import time
 import signal
 import os
 
+# Signals that should shut down the supervised process
+_SHUTDOWN_SIGNALS = {signal.SIGTERM, signal.SIGINT}
+# Waiting on SIGCHLD as well means the supervisor wakes the moment the
+# child exits instead of at the next poll interval
+_WAIT_SIGNALS = _SHUTDOWN_SIGNALS | {signal.SIGCHLD}
+
+# Retry backoff parameters
+_BACKOFF_BASE = 1.0
+_BACKOFF_CAP = 60.0
+_BACKOFF_JITTER = 0.5
+
+
+def _retry_delay(retries):
+    """Exponential backoff with jitter: transient failures restart quickly
+    while persistent crash loops back off toward the cap. The retry counter
+    (and therefore the delay) resets after a long successful run."""
+    return min(_BACKOFF_CAP, _BACKOFF_BASE * (2 ** retries)) + random.random() * _BACKOFF_JITTER
+
+
+def terminate_process(process):
+    """Gracefully stop the child: SIGTERM to its process group, short grace
+    period, then SIGKILL if it is still running"""
+    try:
+        # The child was started with start_new_session=True, so its pgid
+        # equals its pid — no getpgid() lookup needed
+        try:
+            os.killpg(process.pid, signal.SIGTERM)
+            print(f"Sent SIGTERM to process group {process.pid}")
+        except (ProcessLookupError, OSError):
+            # Fall back to terminating just the process
+            process.terminate()
+            print(f"Sent SIGTERM to process {process.pid}")
+
+        # Give a short time for graceful shutdown
+        time.sleep(1.0)
+
+        # Check if still running and force kill if needed
+        if process.poll() is None:
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+                print(f"Force killed process group {process.pid}")
+            except (ProcessLookupError, OSError):
+                process.kill()
+                print(f"Force killed process {process.pid}")
+    except Exception as e:
+        print(f"Error during process termination: {e}")
+
+
+def _backoff_sleep(delay, use_sigwait):
+    """Wait out a retry backoff without going deaf to shutdown signals.
+
+    With the wait-signal set blocked, a plain sleep would defer
+    SIGTERM/SIGINT until the next unblock around the spawn — up to the
+    backoff cap — and then deliver them as the default (fatal) action.
+    Consume them here instead and exit cleanly; the child has already
+    exited by the time a backoff starts, so there is nothing to tear
+    down."""
+    if not use_sigwait:
+        time.sleep(delay)
+        return
+    deadline = time.monotonic() + delay
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        sig = signal.sigtimedwait(_WAIT_SIGNALS, remaining)
+        if sig is None or sig.si_signo == signal.SIGCHLD:
+            continue
+        print(f"\nReceived signal {sig.si_signo} during restart backoff. Exiting...")
+        sys.exit(0)
+
+
+def _wait_or_handle_signal(process):
+    """Wait for the child to exit, consuming shutdown signals synchronously.
+
+    Instead of installing an async signal handler (whose body — print,
+    killpg, sleep — is not async-signal-safe and dispatches through the
+    interpreter's signal thunk), we block SIGTERM/SIGINT and poll for them
+    with sigtimedwait between child liveness checks. Signal handling then
+    runs in a normal Python context.
+    """
+    while True:
+        if process.poll() is not None:
+            return
+        # Blocks until the child exits (SIGCHLD), a shutdown signal
+        # arrives, or the timeout lapses; the timeout is only a safety
+        # net against missed wakeups, not the detection latency
+        sig = signal.sigtimedwait(_WAIT_SIGNALS, 5.0)
+        if sig is None or sig.si_signo == signal.SIGCHLD:
+            continue
+        print(f"\nReceived signal {sig.si_signo}. Shutting down...")
+        terminate_process(process)
+        sys.exit(0)
+
+
 def run_with_retries(command, max_retries=3):
+    # Accept either a pre-split argv list or a shell-style string. Parsing
+    # once with shlex and exec'ing the command directly avoids forking an
+    # intermediate /bin/sh per retry, and means SIGTERM reaches the real
+    # process instead of a shell wrapper.
+    if isinstance(command, str):
+        cmd_list = shlex.split(command)
+    else:
+        cmd_list = list(command)
+
+    # Block shutdown signals so they can be consumed synchronously in the
+    # wait loop rather than via an async handler
+    use_sigwait = hasattr(signal, "pthread_sigmask") and hasattr(signal, "sigtimedwait")
+    if use_sigwait:
+        signal.pthread_sigmask(signal.SIG_BLOCK, _WAIT_SIGNALS)
+    else:
+        # No sigtimedwait (macOS): route SIGTERM through
+        # KeyboardInterrupt so the handler below tears down the child
+        # group just like Ctrl+C — otherwise SIGTERM would kill the
+        # supervisor and orphan the child in its own session
+        signal.signal(signal.SIGTERM, signal.default_int_handler)
+
     retries = 0
     while retries < max_retries:
         try:
-            process = subprocess.Popen(command, shell=True)
+            # Unblock around the spawn so the child doesn't inherit a mask
+            # with SIGTERM/SIGINT blocked (it would ignore our SIGTERM)
+            if use_sigwait:
+                signal.pthread_sigmask(signal.SIG_UNBLOCK, _WAIT_SIGNALS)
+            # start_new_session runs setsid() in the child on the fast
+            # fork path without re-entering Python, unlike preexec_fn
+            process = subprocess.Popen(cmd_list, start_new_session=True)
+            if use_sigwait:
+                signal.pthread_sigmask(signal.SIG_BLOCK, _WAIT_SIGNALS)
             # Reset retries if the process runs for more than 30 seconds
             # This indicates a successful start
             start_time = time.time()
-            
-            def signal_handler(signum, frame):
-                if process:
+
+            if use_sigwait:
+                _wait_or_handle_signal(process)
+            else:
+                # Retry if a signal interrupts the wait (EINTR)
+                while True:
                     try:
-                        # Try to kill the process group first
-                        try:
-                            pgid = os.getpgid(process.pid)
-                            os.killpg(pgid, signal.SIGTERM)
-                            print(f"Sent SIGTERM to process group {pgid}")
-                        except (ProcessLookupError, OSError):
-                            # Fall back to terminating just the process
-                            process.terminate()
-                            print(f"Sent SIGTERM to process {process.pid}")
-                        
-                        # Give a short time for graceful shutdown
-                        time.sleep(1.0)
-                        
-                        # Check if still running and force kill if needed
-                        if process.poll() is None:
-                            try:
-                                pgid = os.getpgid(process.pid)
-                                os.killpg(pgid, signal.SIGKILL)
-                                print(f"Force killed process group {pgid}")
-                            except (ProcessLookupError, OSError):
-                                process.kill()
-                                print(f"Force killed process {process.pid}")
-                    except Exception as e:
-                        print(f"Error during process termination: {e}")
-                sys.exit(0)
-            
-            # Handle termination signals
-            signal.signal(signal.SIGTERM, signal_handler)
-            signal.signal(signal.SIGINT, signal_handler)
-            
-            process.wait()
-            
+                        process.wait()
+                        break
+                    except InterruptedError:
+                        continue
+
             # If process ran for more than 30 seconds before exiting
             # reset the retry counter as it was a successful run
             if time.time() - start_time > 30:
@@ -57,58 +159,42 @@ def run_with_retries(command, max_retries=3):
             else:
                 retries += 1
                 print(f"\nProcess exited quickly. Retry {retries}/{max_retries}")
-            
+
             # If process exited with non-zero status
             if process.returncode != 0:
                 if retries < max_retries:
-                    print(f"Process failed with exit code {process.returncode}. Restarting in 5 seconds...")
-                    time.sleep(5)
+                    delay = _retry_delay(retries)
+                    print(f"Process failed with exit code {process.returncode}. Restarting in {delay:.1f} seconds...")
+                    _backoff_sleep(delay, use_sigwait)
                 else:
                     print(f"Process failed {max_retries} times. Giving up.")
                     sys.exit(1)
             # If process exited with zero status but quickly
             elif time.time() - start_time <= 30:
                 if retries < max_retries:
-                    print("Process exited successfully but too quickly. Restarting in 5 seconds...")
-                    time.sleep(5)
+                    delay = _retry_delay(retries)
+                    print(f"Process exited successfully but too quickly. Restarting in {delay:.1f} seconds...")
+                    _backoff_sleep(delay, use_sigwait)
                 else:
                     print(f"Process exited quickly {max_retries} times. Giving up.")
                     sys.exit(1)
-            
+
         except KeyboardInterrupt:
+            # Only reachable when signals are not blocked (no sigtimedwait)
             if process:
                 print("\nKeyboard interrupt detected. Shutting down...")
-                try:
-                    # Try to kill the process group first
-                    try:
-                        pgid = os.getpgid(process.pid)
-                        os.killpg(pgid, signal.SIGTERM)
-                        print(f"Sent SIGTERM to process group {pgid}")
-                    except (ProcessLookupError, OSError):
-                        # Fall back to terminating just the process
-                        process.terminate()
-                        print(f"Sent SIGTERM to process {process.pid}")
-                    
-                    # Give a short time for graceful shutdown
-                    time.sleep(1.0)
-                    
-                    # Check if still running and force kill if needed
-                    if process.poll() is None:
-                        try:
-                            pgid = os.getpgid(process.pid)
-                            os.killpg(pgid, signal.SIGKILL)
-                            print(f"Force killed process group {pgid}")
-                        except (ProcessLookupError, OSError):
-                            process.kill()
-                            print(f"Force killed process {process.pid}")
-                except Exception as e:
-                    print(f"Error during process termination: {e}")
+                terminate_process(process)
             sys.exit(0)
 
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python keep_alive.py <command>")
         sys.exit(1)
-    
-    command = " ".join(sys.argv[1:])
-    run_with_retries(command) 
\ No newline at end of file
+
+    # Support both invocation styles: the documented
+    # `python keep_alive.py "<command>"` (one quoted command string,
+    # which run_with_retries shlex-splits) and a pre-split argv as the
+    # launcher passes it
+    args = sys.argv[1:]
+    run_with_retries(args[0] if len(args) == 1 else args)
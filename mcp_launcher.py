@@ -3,7 +3,6 @@ import argparse
 import subprocess
 import sys
 import json
-import multiprocessing
 import signal
 import time
 import os
@@ -24,67 +23,94 @@ def get_server_list(config_file='mcp_config.json'):
 
 def launch_single_server(server_name, keep_alive=False):
     """Launch a single MCP server"""
-    cmd = f"python mcp_servers.py run {server_name}"
-    
+    # Exec the interpreter directly rather than going through /bin/sh:
+    # shell=True cost an extra fork+exec and would mangle server names
+    # containing shell metacharacters
+    cmd = [sys.executable, "mcp_servers.py", "run", server_name]
+
     if keep_alive:
         run_with_retries(cmd)
     else:
-        subprocess.run(cmd, shell=True)
+        subprocess.run(cmd, check=False)
 
-def server_process(server_name, keep_alive):
-    """Function to run in a separate process for each server"""
-    try:
-        print(f"Starting server: {server_name}")
-        launch_single_server(server_name, keep_alive)
-    except KeyboardInterrupt:
-        print(f"\nStopping server: {server_name}")
-    except Exception as e:
-        print(f"Error in server {server_name}: {e}")
+def server_command(server_name, keep_alive=False):
+    """Build the argv for a server child process, optionally wrapped in the
+    keep-alive supervisor"""
+    cmd = [sys.executable, "mcp_servers.py", "run", server_name]
+    if keep_alive:
+        cmd = [sys.executable, "keep_alive.py"] + cmd
+    return cmd
 
 def launch_servers(keep_alive=False, config_file='mcp_config.json'):
     """Launch all MCP servers in parallel with independent monitoring"""
     servers = get_server_list(config_file)
     processes = []
-    
+
+    # Ship the raw config to the children through the environment so each
+    # one skips its own stat+open+parse of the same file (configs are a
+    # few KB, well under the environment size limit)
+    child_env = os.environ.copy()
     try:
-        # Launch each server in its own process
+        with open(config_file) as f:
+            child_env["MCP_CONFIG_JSON"] = f.read()
+    except OSError:
+        pass
+
+    try:
+        # Spawn each server directly with Popen. The previous version
+        # forked a multiprocessing.Process whose only job was to exec
+        # another interpreter — with the spawn start method that's two
+        # full CPython startups per server. Keep-alive supervision now
+        # runs in the child (keep_alive.py is its entry point) instead
+        # of a parent wrapper process.
         for server in servers:
-            p = multiprocessing.Process(
-                target=server_process,
-                args=(server, keep_alive),
-                name=f"server-{server}"
+            print(f"Starting server: {server}")
+            p = subprocess.Popen(
+                server_command(server, keep_alive),
+                env=child_env,
+                start_new_session=True
             )
-            p.start()
             processes.append(p)
-        
-        # Wait for all processes to complete
+
+        # Wait for all children to exit
         # This allows us to catch keyboard interrupts
         for p in processes:
-            p.join()
-            
+            p.wait()
+
     except KeyboardInterrupt:
         print("\nShutting down all servers...")
         # Terminate all processes on keyboard interrupt
         for p in processes:
-            if p.is_alive():
-                # First try SIGTERM for clean shutdown
-                p.terminate()
-                
-        # Give a short grace period
-        time.sleep(1.0)
-        
+            if p.poll() is None:
+                # First try SIGTERM for clean shutdown; the children run
+                # in their own sessions, so signal the whole group
+                try:
+                    os.killpg(p.pid, signal.SIGTERM)
+                except (ProcessLookupError, OSError):
+                    p.terminate()
+
+        # Give a short grace period, polling so we move on to the
+        # force-kill pass as soon as every child has actually exited
+        deadline = time.monotonic() + 1.0
+        while time.monotonic() < deadline:
+            if all(p.poll() is not None for p in processes):
+                break
+            time.sleep(0.02)
+
         # Force kill any remaining processes
         for p in processes:
-            if p.is_alive():
+            if p.poll() is None:
                 try:
-                    # Try to get the process ID and kill the process group
-                    os.kill(p.pid, signal.SIGKILL)
+                    os.killpg(p.pid, signal.SIGKILL)
                     print(f"Force killed process {p.pid}")
-                except OSError:
+                except (ProcessLookupError, OSError):
+                    pass
+
+                # Make sure to reap after killing
+                try:
+                    p.wait(timeout=0.1)
+                except subprocess.TimeoutExpired:
                     pass
-                
-                # Make sure to join after killing
-                p.join(timeout=0.1)
         
         # Additionally, run the stop command to clean up any lingering processes
         try:
@@ -103,9 +129,7 @@ def main():
     parser.add_argument("--keep-alive", action="store_true", help="Enable keep-alive functionality")
     parser.add_argument("--config", default="mcp_config.json", help="Path to config file")
     args = parser.parse_args()
-    
-    # Set multiprocessing start method
-    multiprocessing.set_start_method('spawn')
+
     launch_servers(args.keep_alive, args.config)
 
 if __name__ == "__main__":
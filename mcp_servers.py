@@ -1,64 +1,165 @@
 #!/usr/bin/env python3
 
 import argparse
+import asyncio
+import functools
 import json
 import os
+import re
+import select
+import shlex
+import shutil
+import socket
 import subprocess
 import sys
 import time
 import signal
 import atexit
+import fcntl
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from typing import Dict, List, Optional
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+@functools.lru_cache(maxsize=None)
+def _load_env_file():
+    """Load .env on first use instead of at import time.
+
+    Only the run path cares about the extra environment variables, so
+    commands like list and remove skip both the dotenv import and the
+    file parse. The cache makes repeat calls (including concurrent ones
+    from the launch thread pool) effectively free."""
+    from dotenv import load_dotenv
+    load_dotenv()
+    return True
+
 
 # Keep track of background processes for cleanup
 background_processes = []
 
+# Launched-server records, one JSON line each, so a later invocation's
+# `stop` can find servers this process started
+PID_FILE = "/tmp/mcp-servers.pids"
+
+# Informational chatter is opt-in: every print serializes on the stdout
+# lock, which the parallel launcher threads otherwise contend for
+VERBOSE = bool(int(os.environ.get("MCP_VERBOSE", "0") or "0"))
+
+
+def _vprint(*args, **kwargs):
+    """print() for progress detail that only --verbose runs care about"""
+    if VERBOSE:
+        print(*args, **kwargs)
+
+# ${VAR} references in configured env values
+_ENV_RE = re.compile(r"\$\{([A-Za-z_][A-Za-z0-9_]*)\}")
+
+
+def _reap_all_nohang() -> Dict[int, int]:
+    """Drain every pending child exit in one waitid loop.
+
+    Returns {pid: exitcode} (negative signal number for killed
+    children, matching Popen). A WNOWAIT sweep would let each proc's
+    own poll() collect the status later, but waitid(P_ALL, WNOHANG |
+    WEXITED | WNOWAIT) keeps returning the same child because nothing
+    consumes its status — so this consumes as it goes and the caller
+    records the codes on the proc objects instead of re-polling."""
+    dead = {}
+    while True:
+        try:
+            info = os.waitid(os.P_ALL, 0, os.WNOHANG | os.WEXITED)
+        except (ChildProcessError, OSError):
+            break
+        if info is None:
+            break
+        if info.si_code == os.CLD_EXITED:
+            dead[info.si_pid] = info.si_status
+        else:
+            dead[info.si_pid] = -info.si_status
+    return dead
+
 
 def cleanup_background_processes(force_kill=False):
     """Terminate any background processes on exit"""
     if not background_processes:
         return
         
-    print(f"Cleaning up {len(background_processes)} background processes...")
-    
-    # Always start with SIGTERM for graceful shutdown
+    # Buffer the per-process chatter and emit it in one write at the
+    # end: each print() would otherwise take the stdout lock and flush
+    # individually, right when atexit/signal handlers want to be quick
+    lines = [f"Cleaning up {len(background_processes)} background processes...\n"]
+
+    # One waitid sweep replaces a waitpid-per-child poll() pass: every
+    # already-dead child is reaped here and its code recorded, so only
+    # the genuinely live children cost further syscalls below
+    dead = _reap_all_nohang()
+
+    # Resolve each live child's process group once up front; the
+    # SIGKILL pass below reuses the same pgids instead of repeating
+    # the getpgid syscalls
+    groups = []
     for proc in background_processes:
+        if proc.returncode is not None:
+            continue
+        if proc.pid in dead:
+            proc.returncode = dead[proc.pid]
+            continue
         try:
-            if proc.poll() is None:  # Check if process is still running
-                # Try to kill the entire process group if possible
-                try:
-                    pgid = os.getpgid(proc.pid)
-                    os.killpg(pgid, signal.SIGTERM)
-                    print(f"Sent SIGTERM to process group {pgid}")
-                except (ProcessLookupError, OSError, AttributeError):
-                    # Fall back to terminating just the process
-                    proc.send_signal(signal.SIGTERM)
-                    print(f"Sent SIGTERM to process {proc.pid}")
+            pgid = os.getpgid(proc.pid)
+        except (ProcessLookupError, OSError):
+            pgid = None
+        groups.append((proc, pgid))
+
+    # Always start with SIGTERM for graceful shutdown
+    for proc, pgid in groups:
+        try:
+            if pgid is not None:
+                # Kill the entire process group if possible
+                os.killpg(pgid, signal.SIGTERM)
+                lines.append(f"Sent SIGTERM to process group {pgid}\n")
+            else:
+                # Fall back to terminating just the process
+                proc.send_signal(signal.SIGTERM)
+                lines.append(f"Sent SIGTERM to process {proc.pid}\n")
         except (ProcessLookupError, OSError) as e:
-            print(f"Error terminating process {proc.pid}: {e}")
-    
-    # Wait time depends on force_kill mode - very short if force_kill
-    wait_time = 1.0 if force_kill else 1.0
-    time.sleep(wait_time)
-    
-    # Send SIGKILL to any remaining processes
-    for proc in background_processes:
+            lines.append(f"Error terminating process {proc.pid}: {e}\n")
+
+    # Wait time depends on force_kill mode - very short if force_kill,
+    # since the caller has already decided to escalate to SIGKILL
+    wait_time = 0.1 if force_kill else 1.0
+    # Give each child whatever remains of the shared grace budget.
+    # wait() blocks until that child exits (and reaps it), so a clean
+    # teardown finishes in milliseconds and only stragglers spend the
+    # budget before the SIGKILL pass below.
+    deadline = time.monotonic() + wait_time
+    for proc, _ in groups:
+        try:
+            proc.wait(timeout=max(0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            pass
+
+    # Send SIGKILL to any remaining processes, reusing the pgids
+    # resolved above
+    for proc, pgid in groups:
         try:
             if proc.poll() is None:  # Still running after terminate
-                try:
-                    pgid = os.getpgid(proc.pid)
+                if pgid is not None:
                     os.killpg(pgid, signal.SIGKILL)
-                    print(f"Force killed process group {pgid}")
-                except (ProcessLookupError, OSError, AttributeError):
+                    lines.append(f"Force killed process group {pgid}\n")
+                else:
                     proc.kill()          # Force kill
-                    print(f"Force killed process {proc.pid}")
+                    lines.append(f"Force killed process {proc.pid}\n")
         except (ProcessLookupError, OSError):
             pass
-                
+
+    sys.stdout.write("".join(lines))
+    sys.stdout.flush()
+
     # Clear the list of background processes
     background_processes.clear()
 
@@ -67,22 +168,33 @@ def cleanup_background_processes(force_kill=False):
 atexit.register(cleanup_background_processes)
 
 
+@dataclass(slots=True)
 class MCPServer:
-    def __init__(
-        self,
-        name: str,
-        command: str,
-        args: List[str] = None,
-        env: Dict[str, str] = None,
-        port: Optional[int] = None,
-        server_type: str = "stdio"  # New parameter for server type (stdio or sse)
-    ):
-        self.name = name
-        self.command = command
-        self.args = args or []
-        self.env = env or {}
-        self.port = port
-        self.server_type = server_type  # Store the server type
+    """One configured server record.
+
+    slots=True keeps instances __dict__-free — smaller objects and
+    slightly faster attribute access when a large config is
+    materialized on every CLI call — while the generated __init__,
+    __repr__ and __eq__ replace the hand-written boilerplate."""
+    name: str
+    command: str
+    args: List[str] = field(default_factory=list)
+    env: Dict[str, str] = field(default_factory=dict)
+    port: Optional[int] = None
+    server_type: str = "stdio"  # stdio (needs supergateway) or sse
+    # Lazily joined command string; internal memo, not configured state
+    _cmd_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def cmd_str(self) -> str:
+        """Shell-quoted "command args..." string, joined once per object.
+
+        shlex.join quotes arguments containing spaces or shell
+        metacharacters, which the previous bare ' '.join silently broke
+        when the result was handed to supergateway --stdio."""
+        if self._cmd_str is None:
+            self._cmd_str = shlex.join([self.command, *self.args])
+        return self._cmd_str
 
     def to_dict(self) -> Dict:
         return {
@@ -96,36 +208,354 @@ class MCPServer:
 
     @classmethod
     def from_dict(cls, data: Dict) -> "MCPServer":
+        # `or` rather than a .get default so explicit nulls in the
+        # config also normalize to empty containers
+        args = data.get("args") or []
+        # Migrate legacy single-string args like "-y @scope/pkg": the
+        # old unquoted join let the shell re-split them, but cmd_str
+        # now quotes them into one literal argument. A lone flag
+        # bundled with its value can never be a real single argv
+        # element, so split it; lone non-flag strings (e.g. paths
+        # containing spaces) are left alone.
+        if len(args) == 1 and isinstance(args[0], str) and args[0].startswith("-") and " " in args[0]:
+            args = shlex.split(args[0])
         return cls(
             name=data["name"],
             command=data["command"],
-            args=data.get("args", []),
-            env=data.get("env", {}),
+            args=args,
+            env=data.get("env") or {},
             port=data.get("port"),
             server_type=data.get("server_type", "stdio")  # Default to stdio for backward compatibility
         )
 
 
+class SpawnedProcess:
+    """Minimal Popen lookalike for children started with os.posix_spawn.
+
+    Implements just the surface the launch/verify/cleanup code touches:
+    pid, returncode, poll, wait, send_signal, terminate and kill."""
+    __slots__ = ("pid", "returncode")
+
+    def __init__(self, pid: int):
+        self.pid = pid
+        self.returncode = None
+
+    def poll(self) -> Optional[int]:
+        if self.returncode is None:
+            try:
+                pid, status = os.waitpid(self.pid, os.WNOHANG)
+            except ChildProcessError:
+                # Reaped elsewhere; treat as exited
+                self.returncode = 0
+                return self.returncode
+            if pid == self.pid:
+                self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+
+    def wait(self, timeout: Optional[float] = None) -> int:
+        if self.returncode is not None:
+            return self.returncode
+        if timeout is None:
+            try:
+                _, status = os.waitpid(self.pid, 0)
+                self.returncode = os.waitstatus_to_exitcode(status)
+            except ChildProcessError:
+                self.returncode = 0
+            return self.returncode
+        deadline = time.monotonic() + timeout
+        while self.poll() is None:
+            if time.monotonic() >= deadline:
+                raise subprocess.TimeoutExpired(str(self.pid), timeout)
+            time.sleep(0.02)
+        return self.returncode
+
+    def send_signal(self, sig: int):
+        os.kill(self.pid, sig)
+
+    def terminate(self):
+        self.send_signal(signal.SIGTERM)
+
+    def kill(self):
+        self.send_signal(signal.SIGKILL)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_config_cached(config_file: str, mtime_ns: int) -> tuple:
+    """Parse the config file, memoized on (path, mtime) so repeated loads
+    within one invocation reuse the parse. A saved config bumps the mtime
+    and naturally misses the cache."""
+    with open(config_file, 'rb') as f:
+        raw = f.read()
+    # orjson parses several times faster than the stdlib; fall back
+    # silently when it isn't installed
+    config_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    return tuple(MCPServer.from_dict(server_data) for server_data in config_data["servers"])
+
+
 def load_config(config_file: str) -> List[MCPServer]:
-    try:
-        with open(config_file, 'r') as f:
-            config_data = json.load(f)
+    # The launcher hands its already-read config down through the
+    # environment, so N run children don't each re-stat and re-parse the
+    # same file in a stampede at startup
+    inline = os.environ.get("MCP_CONFIG_JSON")
+    if inline:
+        try:
+            config_data = orjson.loads(inline) if orjson is not None else json.loads(inline)
             return [MCPServer.from_dict(server_data) for server_data in config_data["servers"]]
-    except (FileNotFoundError, json.JSONDecodeError) as e:
+        except (ValueError, KeyError) as e:
+            print(f"Error parsing MCP_CONFIG_JSON: {e}")
+            sys.exit(1)
+    try:
+        mtime_ns = os.stat(config_file).st_mtime_ns
+        return list(_load_config_cached(config_file, mtime_ns))
+    except (FileNotFoundError, ValueError) as e:
+        # ValueError covers JSONDecodeError from both parsers
         print(f"Error loading config file: {e}")
         sys.exit(1)
 
 
+def load_one(config_file: str, name: str) -> Optional[MCPServer]:
+    """Fetch a single server's record without materializing the rest.
+
+    The JSON decode is one C-level pass either way; the per-record
+    Python cost is MCPServer construction, and this skips it for every
+    record but the match. Used by commands that only touch one server."""
+    raw = os.environ.get("MCP_CONFIG_JSON")
+    try:
+        if raw is None:
+            with open(config_file, 'rb') as f:
+                raw = f.read()
+        config_data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"Error loading config file: {e}")
+        sys.exit(1)
+    for server_data in config_data.get("servers", []):
+        if server_data.get("name") == name:
+            return MCPServer.from_dict(server_data)
+    return None
+
+
 def save_config(config_file: str, servers: List[MCPServer]):
     config_data = {"servers": [server.to_dict() for server in servers]}
-    with open(config_file, 'w') as f:
-        json.dump(config_data, f, indent=2)
+    if orjson is not None:
+        raw = orjson.dumps(config_data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        raw = (json.dumps(config_data, indent=2) + "\n").encode()
+    # Serialize concurrent savers on a sibling lock file: two CLI
+    # invocations share the same .tmp path, and without the lock their
+    # interleaved writes could be renamed into place half-formed
+    lock_path = config_file + ".lock"
+    tmp_path = config_file + ".tmp"
+    with open(lock_path, 'w') as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        # Write a sibling temp file, flush it to disk, and rename it into
+        # place: os.replace is atomic, so a crash mid-write can never
+        # leave a truncated config — which also means readers need no
+        # lock of their own, they always see the old or the new file
+        with open(tmp_path, 'wb') as f:
+            f.write(raw)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, config_file)
+    # Drop stale parses in case the rewrite lands within mtime granularity
+    _load_config_cached.cache_clear()
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_command(command: str) -> str:
+    """Resolve a bare command name to an absolute path, once per process.
+
+    exec'ing a bare name makes the child walk PATH with one exec attempt
+    per entry; resolving here does that walk once and, together with the
+    other posix_spawn preconditions, lets Popen skip fork entirely."""
+    return shutil.which(command) or command
+
+
+def _run_helper(cmd, **kwargs):
+    """subprocess.run wrapper for short-lived helper commands (npm, git).
+
+    An absolute argv[0] and close_fds=False are among the conditions
+    CPython checks before choosing posix_spawn over fork+exec. With a
+    parent tracking many background servers, fork has to copy ever more
+    page tables (notably slow on macOS); posix_spawn sidesteps that.
+    Server children still use fork via start_new_session — they need
+    their own process group for shutdown signalling."""
+    cmd = [_resolve_command(cmd[0])] + list(cmd[1:])
+    kwargs.setdefault("close_fds", False)
+    return subprocess.run(cmd, **kwargs)
+
+
+@functools.lru_cache(maxsize=1)
+def _find_supergateway() -> Optional[str]:
+    """Locate an installed supergateway binary so launches can skip npx.
+
+    npx -y supergateway consults the npm registry whenever its cache is
+    cold — often seconds per launch, which dominates run-all startup.
+    With the binary on PATH (npm install -g supergateway) we exec it
+    directly; otherwise launches keep the npx fallback."""
+    return shutil.which("supergateway")
+
+
+# On-disk cache of `npm view <pkg> version` results, shared across
+# servers and invocations: several configured servers often wrap the
+# same package, and restarts within the TTL skip the registry entirely
+_VERSION_CACHE_PATH = os.path.expanduser("~/.cache/mcp-server-manager/npm_versions.json")
+_VERSION_CACHE_TTL = 6 * 3600  # seconds
 
 
-def check_and_update_server(server: MCPServer) -> bool:
-    """Check if server needs updates and auto-update if necessary"""
+def _load_version_cache() -> Dict:
+    """Read the npm version cache; a missing or corrupt file means empty"""
+    try:
+        with open(_VERSION_CACHE_PATH, "rb") as f:
+            raw = f.read()
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_version_cache(cache: Dict):
+    """Persist the npm version cache atomically (tmpfile + os.replace).
+
+    The cache is purely an optimization, so write failures are swallowed
+    rather than allowed to fail a launch."""
+    try:
+        os.makedirs(os.path.dirname(_VERSION_CACHE_PATH), exist_ok=True)
+        data = orjson.dumps(cache) if orjson is not None else json.dumps(cache).encode()
+        tmp_path = _VERSION_CACHE_PATH + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, _VERSION_CACHE_PATH)
+    except OSError:
+        pass
+
+
+# Marker file whose mtime records the last completed update-check pass;
+# restarts within the interval skip the whole npm/git phase
+_LAST_UPDATE_CHECK_PATH = os.path.expanduser("~/.cache/mcp-server-manager/last_update_check")
+
+
+def _updates_due(no_update: bool, interval_hours: float) -> bool:
+    """Decide whether this invocation should run the update checks.
+
+    --no-update wins outright; otherwise the marker file's mtime
+    rate-limits the checks to once per interval. A missing or
+    unreadable marker means "never checked", so the checks run."""
+    if no_update:
+        return False
+    try:
+        if time.time() - os.path.getmtime(_LAST_UPDATE_CHECK_PATH) < interval_hours * 3600:
+            return False
+    except OSError:
+        pass
+    return True
+
+
+def _touch_last_update_check():
+    """Record that an update-check pass just completed"""
+    try:
+        os.makedirs(os.path.dirname(_LAST_UPDATE_CHECK_PATH), exist_ok=True)
+        with open(_LAST_UPDATE_CHECK_PATH, "a"):
+            pass
+        os.utime(_LAST_UPDATE_CHECK_PATH)
+    except OSError:
+        pass
+
+
+async def _run_check(cmd, timeout, cwd=None):
+    """Async counterpart of _run_helper for the update-check phase.
+
+    Returns (returncode, stdout, stderr) with the output decoded. The
+    subprocess itself is the same npm/git invocation as before; running
+    it on the event loop lets every server's checks overlap their
+    network waits in one gather. A timeout kills the child before
+    propagating so no zombie survives the check phase."""
+    proc = await asyncio.create_subprocess_exec(
+        _resolve_command(cmd[0]), *cmd[1:],
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.communicate()
+        raise
+    return proc.returncode, stdout.decode(errors="replace"), stderr.decode(errors="replace")
+
+
+@functools.lru_cache(maxsize=256)
+def _is_git_repo(project_dir: str) -> bool:
+    """Memoized .git check: one stat per unique directory per process,
+    instead of one per server per update pass"""
+    return os.path.isdir(os.path.join(project_dir, ".git"))
+
+
+def _git_project_dir(server: MCPServer) -> Optional[str]:
+    """Resolve the git checkout a local server runs from, if any"""
+    if server.command in ("uv", "node") and server.args:
+        if "--directory" in server.args:
+            dir_idx = server.args.index("--directory") + 1
+            if dir_idx >= len(server.args):
+                return None
+            project_dir = server.args[dir_idx]
+        elif server.command == "node":
+            project_dir = os.path.dirname(server.args[0])
+        else:
+            return None
+        if _is_git_repo(project_dir):
+            return project_dir
+    return None
+
+
+async def _git_update_if_behind(project_dir: str) -> bool:
+    """fetch + status -uno for one checkout, pulling if it is behind"""
+    _vprint(f"Checking for git updates in {project_dir}")
+    try:
+        # Fetch latest and check if updates available
+        await _run_check(["git", "fetch"], timeout=10, cwd=project_dir)
+        _, status_out, _ = await _run_check(
+            ["git", "status", "-uno"], timeout=5, cwd=project_dir
+        )
+        if "behind" in status_out:
+            # Pull updates
+            pull_returncode, _, pull_err = await _run_check(
+                ["git", "pull"], timeout=30, cwd=project_dir
+            )
+            if pull_returncode == 0:
+                print(f"✅ Updated git repository: {project_dir}")
+                return True
+            print(f"Failed to update {project_dir}: {pull_err}")
+    except (asyncio.TimeoutError, OSError) as e:
+        print(f"Could not check git updates for {project_dir}: {e}")
+    return False
+
+
+# One in-flight git update task per checkout: sibling servers pointing
+# at the same repo (monorepo with several entry points) share a single
+# fetch/status/pull instead of racing duplicates
+_git_update_tasks: Dict[str, "asyncio.Task"] = {}
+
+
+async def _git_update_shared(project_dir: str) -> bool:
+    """Await the checkout's shared update task, creating it on first use.
+
+    The task map survives across event loops within one process, so a
+    stale task from a finished loop is replaced rather than awaited."""
+    task = _git_update_tasks.get(project_dir)
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.ensure_future(_git_update_if_behind(project_dir))
+        _git_update_tasks[project_dir] = task
+    return await task
+
+
+async def check_and_update_server(server: MCPServer) -> bool:
+    """Check if server needs updates and auto-update if necessary.
+
+    Async so the npm/git round-trips of many servers can run
+    concurrently — the checks are pure network/disk waits, and serially
+    they dominate run-all startup."""
     update_performed = False
-    
+
     try:
         if server.command in ["npx", "uvx"]:
             # For npx/uvx commands, check if package needs update
@@ -136,166 +566,432 @@ def check_and_update_server(server: MCPServer) -> bool:
                     package_name = server.args[server.args.index("-y") + 1]
                 elif len(server.args) > 0 and not server.args[0].startswith("-"):
                     package_name = server.args[0]
-                
-                if package_name:
-                    print(f"Checking for updates for npm package: {package_name}")
+
+                cached = _load_version_cache().get(package_name) if package_name else None
+                if cached and time.time() - cached.get("ts", 0) < _VERSION_CACHE_TTL:
+                    # Another server entry (or a recent run) already
+                    # confirmed this package within the TTL; skip the
+                    # registry round-trip entirely
+                    _vprint(f"Using cached version {cached.get('version')} for {package_name}")
+                elif package_name:
+                    _vprint(f"Checking for updates for npm package: {package_name}")
                     # Use npm view to check latest version vs local
                     try:
-                        result = subprocess.run(
-                            ["npm", "view", package_name, "version"],
-                            capture_output=True, text=True, timeout=10
+                        returncode, stdout, _ = await _run_check(
+                            ["npm", "view", package_name, "version"], timeout=10
                         )
-                        if result.returncode == 0:
-                            latest_version = result.stdout.strip()
-                            print(f"Latest version available: {latest_version}")
+                        if returncode == 0:
+                            latest_version = stdout.strip()
+                            _vprint(f"Latest version available: {latest_version}")
+                            # Remember the confirmed version so sibling
+                            # servers and later runs inside the TTL skip
+                            # the check (atomic replace; a lost race just
+                            # means one extra re-check later)
+                            cache = _load_version_cache()
+                            cache[package_name] = {"version": latest_version, "ts": time.time()}
+                            _save_version_cache(cache)
                             # Force update by using npx with --yes flag
-                            update_cmd = ["npx", "--yes", package_name, "--version"]
-                            update_result = subprocess.run(
-                                update_cmd, capture_output=True, text=True, timeout=30
+                            update_returncode, _, _ = await _run_check(
+                                ["npx", "--yes", package_name, "--version"], timeout=30
                             )
-                            if update_result.returncode == 0:
+                            if update_returncode == 0:
                                 print(f"✅ Updated {package_name} to latest version")
                                 update_performed = True
                             else:
-                                print(f"Update check completed for {package_name}")
-                    except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
+                                _vprint(f"Update check completed for {package_name}")
+                    except (asyncio.TimeoutError, OSError) as e:
                         print(f"Could not check updates for {package_name}: {e}")
-            
+
             elif server.command == "uvx":
                 # For uvx (uv), packages are always latest when run
                 package_name = server.args[0] if server.args else None
                 if package_name:
-                    print(f"uvx will use latest version of {package_name}")
-        
+                    _vprint(f"uvx will use latest version of {package_name}")
+
         elif server.command in ["uv", "node"] and server.args:
-            # For local servers, check if they need git updates
-            if "--directory" in server.args:
-                dir_idx = server.args.index("--directory") + 1
-                if dir_idx < len(server.args):
-                    project_dir = server.args[dir_idx]
-                    if os.path.exists(os.path.join(project_dir, ".git")):
-                        print(f"Checking for git updates in {project_dir}")
-                        try:
-                            # Fetch latest and check if updates available
-                            subprocess.run(
-                                ["git", "fetch"], cwd=project_dir, 
-                                capture_output=True, timeout=10
-                            )
-                            result = subprocess.run(
-                                ["git", "status", "-uno"], cwd=project_dir,
-                                capture_output=True, text=True, timeout=5
-                            )
-                            if "behind" in result.stdout:
-                                # Pull updates
-                                pull_result = subprocess.run(
-                                    ["git", "pull"], cwd=project_dir,
-                                    capture_output=True, text=True, timeout=30
-                                )
-                                if pull_result.returncode == 0:
-                                    print(f"✅ Updated git repository: {project_dir}")
-                                    update_performed = True
-                                else:
-                                    print(f"Failed to update {project_dir}: {pull_result.stderr}")
-                        except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
-                            print(f"Could not check git updates for {project_dir}: {e}")
-            
-            elif server.command == "node" and server.args:
-                # Check if it's a local node project
-                script_path = server.args[0]
-                project_dir = os.path.dirname(script_path)
-                if os.path.exists(os.path.join(project_dir, ".git")):
-                    print(f"Checking for git updates in {project_dir}")
-                    try:
-                        subprocess.run(
-                            ["git", "fetch"], cwd=project_dir, 
-                            capture_output=True, timeout=10
-                        )
-                        result = subprocess.run(
-                            ["git", "status", "-uno"], cwd=project_dir,
-                            capture_output=True, text=True, timeout=5
-                        )
-                        if "behind" in result.stdout:
-                            pull_result = subprocess.run(
-                                ["git", "pull"], cwd=project_dir,
-                                capture_output=True, text=True, timeout=30
-                            )
-                            if pull_result.returncode == 0:
-                                print(f"✅ Updated git repository: {project_dir}")
-                                update_performed = True
-                            else:
-                                print(f"Failed to update {project_dir}: {pull_result.stderr}")
-                    except (subprocess.TimeoutExpired, subprocess.CalledProcessError) as e:
-                        print(f"Could not check git updates for {project_dir}: {e}")
-    
+            # For local servers (uv --directory projects and node
+            # scripts alike), check if their checkout needs git updates;
+            # servers sharing a checkout share one fetch via the task map
+            project_dir = _git_project_dir(server)
+            if project_dir:
+                update_performed = await _git_update_shared(project_dir)
+
     except Exception as e:
         print(f"Error during update check for {server.name}: {e}")
-    
+
     return update_performed
 
 
-def run_server(server: MCPServer, use_supergateway: bool = True, run_in_background: bool = False):
-    # Check for updates before starting the server
-    print(f"Checking for updates for {server.name}...")
-    update_performed = check_and_update_server(server)
-    if update_performed:
-        print(f"🔄 {server.name} was updated to the latest version")
-    
-    env = os.environ.copy()
+def check_and_update_servers(servers) -> List[bool]:
+    """Run the update checks for a batch of servers concurrently.
+
+    One event loop, one gather: the batch takes about as long as the
+    slowest single check instead of the sum of all of them."""
+    async def _gather():
+        return await asyncio.gather(
+            *(check_and_update_server(server) for server in servers)
+        )
+    results = asyncio.run(_gather())
+    _touch_last_update_check()
+    return results
+
+
+def _record_server_pid(name: str, pid: int, log_path: str):
+    """Append a JSON line for a launched server to the shared PID file.
+
+    An O_APPEND write of one short line is atomic, so concurrent
+    launcher threads can't interleave records."""
+    line = json.dumps({"name": name, "pid": pid, "log": log_path}) + "\n"
+    try:
+        fd = os.open(PID_FILE, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    except OSError:
+        return
+    try:
+        os.write(fd, line.encode())
+    finally:
+        os.close(fd)
+
+
+def stop_recorded_servers() -> bool:
+    """Stop servers recorded in the PID file by earlier invocations.
+
+    cleanup_background_processes only knows about children of the
+    current process, which made `stop` from a fresh shell a no-op; the
+    PID file is the cross-invocation source of truth. Returns whether
+    anything was signalled."""
+    try:
+        with open(PID_FILE) as f:
+            lines = f.readlines()
+    except FileNotFoundError:
+        return False
+
+    signalled = []
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            entry = json.loads(line)
+            pid = int(entry["pid"])
+        except (ValueError, KeyError, TypeError):
+            continue
+        try:
+            os.killpg(os.getpgid(pid), signal.SIGTERM)
+            print(f"Sent SIGTERM to {entry.get('name', 'server')} (PID {pid})")
+            signalled.append(pid)
+        except OSError:
+            # Stale record; the server already exited
+            continue
+
+    if signalled:
+        # Bounded wait for the group leaders to disappear, then force
+        # kill whatever survived
+        from check_server_port import _wait_for_pids_exit
+        _wait_for_pids_exit(signalled, 1.0)
+        for pid in signalled:
+            try:
+                os.kill(pid, 0)
+            except OSError:
+                continue
+            try:
+                os.killpg(os.getpgid(pid), signal.SIGKILL)
+                print(f"Force killed process group {pid}")
+            except OSError:
+                pass
+
+    try:
+        os.unlink(PID_FILE)
+    except OSError:
+        pass
+    return bool(signalled)
+
+
+def _wait_for_shutdown():
+    """Park the foreground process until Ctrl+C/SIGTERM, reaping children
+    as they exit.
+
+    On Linux each tracked child gets a pidfd registered in one poll set:
+    the parent blocks with zero wakeups, reaps and reports an exit the
+    moment it happens, and returns once the last child is gone. A
+    shutdown signal interrupts the poll. Elsewhere the sigwait path
+    below provides the same behavior at SIGCHLD granularity, with
+    signal.pause as the last resort."""
+    if hasattr(os, "pidfd_open") and background_processes:
+        poller = select.poll()
+        proc_by_fd = {}
+        # Route SIGTERM through the KeyboardInterrupt path so it takes
+        # the same graceful teardown as Ctrl+C
+        previous = signal.signal(signal.SIGTERM, signal.default_int_handler)
+        try:
+            for proc in background_processes:
+                try:
+                    fd = os.pidfd_open(proc.pid)
+                except OSError:
+                    continue  # Already gone; nothing to watch
+                proc_by_fd[fd] = proc
+                poller.register(fd, select.POLLIN)
+            while proc_by_fd:
+                for fd, _ in poller.poll():
+                    proc = proc_by_fd[fd]
+                    proc.wait()
+                    print(f"Server process {proc.pid} exited with code {proc.returncode}")
+                    poller.unregister(fd)
+                    del proc_by_fd[fd]
+                    os.close(fd)
+                    if proc in background_processes:
+                        background_processes.remove(proc)
+            print("All servers have exited.")
+        except KeyboardInterrupt:
+            pass
+        finally:
+            signal.signal(signal.SIGTERM, previous)
+            for fd in proc_by_fd:
+                os.close(fd)
+        return
+
+    if not (hasattr(signal, "pthread_sigmask") and hasattr(signal, "sigwait")):
+        try:
+            while True:
+                signal.pause()
+        except KeyboardInterrupt:
+            return
+
+    mask = {signal.SIGINT, signal.SIGTERM, signal.SIGCHLD}
+    signal.pthread_sigmask(signal.SIG_BLOCK, mask)
+    try:
+        while True:
+            sig = signal.sigwait(mask)
+            if sig != signal.SIGCHLD:
+                return
+            for proc in background_processes[:]:
+                if proc.poll() is not None:
+                    background_processes.remove(proc)
+            if not background_processes:
+                print("All servers have exited.")
+                return
+    finally:
+        signal.pthread_sigmask(signal.SIG_UNBLOCK, mask)
+
+
+def wait_for_port_listening(port: int, process: Optional[subprocess.Popen] = None,
+                            timeout: float = 5.0, interval: float = 0.05) -> bool:
+    """Poll until something accepts connections on the port, the process
+    exits, or the deadline passes.
+
+    Readiness is the port actually accepting, not a timer: a server that
+    is up in 200ms returns in 200ms instead of sitting out a fixed grace
+    sleep, and an immediate crash is caught on the next 50ms tick."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process is not None and process.poll() is not None:
+            return False
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.1):
+                return True
+        except OSError:
+            time.sleep(interval)
+    return False
+
+
+def _wait_for_early_crash(procs: List[subprocess.Popen], timeout: float = 0.5):
+    """Watch a batch of freshly launched children for immediate exits.
+
+    A pidfd becomes readable when its process exits, so one poll() call
+    covers the whole batch: a crashing server wakes us up right away
+    instead of after the full grace sleep, and a healthy batch pays the
+    cap exactly once. Falls back to the fixed sleep where pidfd_open is
+    unavailable (macOS)."""
+    if not hasattr(os, "pidfd_open"):
+        time.sleep(timeout)
+        return
+    poller = select.poll()
+    pidfds = []
+    try:
+        for proc in procs:
+            try:
+                fd = os.pidfd_open(proc.pid)
+            except OSError:
+                # Already exited and reaped; the poll check will catch it
+                continue
+            pidfds.append(fd)
+            poller.register(fd, select.POLLIN)
+        if pidfds:
+            poller.poll(int(timeout * 1000))
+        else:
+            time.sleep(timeout)
+    finally:
+        for fd in pidfds:
+            os.close(fd)
+
+
+def _wait_for_first_output(process, log_path: str, timeout: float = 0.5):
+    """Bounded startup grace that ends at the first sign of life or death.
+
+    The fixed grace sleep made every healthy portless server pay the
+    full timeout. Instead, return as soon as the child writes its first
+    log bytes (the log was truncated at spawn, so any growth is the
+    child's), or as soon as its pidfd fires (early crash — the caller
+    sees it through poll()). Only a silent-but-alive child waits out
+    the whole timeout. poll() reports regular files as always readable,
+    so the log is checked by size between short pidfd waits rather than
+    registered directly."""
+    deadline = time.monotonic() + timeout
+    pidfd = None
+    poller = None
+    if hasattr(os, "pidfd_open"):
+        try:
+            pidfd = os.pidfd_open(process.pid)
+            poller = select.poll()
+            poller.register(pidfd, select.POLLIN)
+        except OSError:
+            pidfd = None
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            try:
+                if os.stat(log_path).st_size > 0:
+                    return
+            except OSError:
+                pass
+            if poller is not None:
+                if poller.poll(max(1, int(min(remaining, 0.05) * 1000))):
+                    # Child exited; reap so the caller's poll() sees it
+                    process.poll()
+                    return
+            else:
+                time.sleep(min(remaining, 0.05))
+    finally:
+        if pidfd is not None:
+            os.close(pidfd)
+
+
+def verify_server_started(server: MCPServer, process: subprocess.Popen,
+                          use_supergateway: bool = True) -> bool:
+    """Check that a background server survived its startup grace period
+    and print its connection details"""
+    if process.poll() is not None:
+        print(f"ERROR: Server {server.name} exited immediately with code {process.returncode}\n"
+              f"Check logs at /tmp/{server.name}.log")
+        return False
+
+    # If it's a stdio server with supergateway, print the connection URL
+    # (single print per server — see the launch-path note above)
+    if use_supergateway and server.server_type == "stdio":
+        port = server.port if server.port else 8000
+        print(f"Server {server.name} is running\n"
+              f"Connect to SSE endpoint: http://localhost:{port}/sse\n"
+              f"POST messages to: http://localhost:{port}/message")
+    else:
+        print(f"Server {server.name} is running")
+    return True
+
+
+@functools.lru_cache(maxsize=1)
+def _base_child_env() -> Dict[str, str]:
+    """Child environment shared by every launch, built once.
+
+    os.environ plus our fixed defaults is identical for all servers in
+    a launch burst, so snapshot it on first use (after .env has been
+    loaded) instead of re-copying the environment per server. Callers
+    overlay per-server variables via a dict display and must never
+    mutate the shared snapshot."""
+    return {
+        **os.environ,
+        # Auto-accept prompts to prevent hanging on update prompts
+        "NPM_CONFIG_YES": "true",  # Auto-accept npm prompts
+        "UV_NO_PROGRESS": "1",     # Disable uv progress bars
+        "UV_QUIET": "1",           # Make uv quieter
+        # Enable faster port reuse; affects Python and Node.js sockets
+        "NODE_OPTIONS": os.environ.get("NODE_OPTIONS", "") + " --unhandled-rejections=strict",
+        "PYTHONUNBUFFERED": "1",   # Ensure unbuffered output
+    }
+
+
+def _prewarm_supergateway():
+    """Warm the supergateway launch path once before a launch burst.
+
+    With a globally installed binary this just primes the
+    _find_supergateway cache so the launcher threads don't race N
+    shutil.which PATH walks. When only the npx fallback exists, one
+    up-front `npx -y supergateway --version` materializes the package
+    in the npx cache, so N parallel launches don't each pay (or
+    stampede) the registry resolution that dominates a cold start."""
+    if _find_supergateway():
+        return
+    try:
+        _run_helper(["npx", "-y", "supergateway", "--version"],
+                    capture_output=True, timeout=30)
+    except (subprocess.TimeoutExpired, OSError):
+        pass
+
+
+def run_server(server: MCPServer, use_supergateway: bool = True, run_in_background: bool = False,
+               startup_grace: Optional[float] = 0.5, skip_update_check: bool = False):
+    # Only the spawn path needs the .env variables
+    _load_env_file()
+
+    # Check for updates before starting the server (batch callers do
+    # this up front for all servers at once and pass skip_update_check)
+    if not skip_update_check:
+        _vprint(f"Checking for updates for {server.name}...")
+        update_performed = asyncio.run(check_and_update_server(server))
+        _touch_last_update_check()
+        if update_performed:
+            print(f"🔄 {server.name} was updated to the latest version")
     
-    # Process environment variables to expand any ${VAR} references
+    # Expand ${VAR} references with one compiled-regex pass per value.
+    # Unlike the old startswith/endswith check, this also substitutes
+    # references embedded in larger strings, e.g. ${HOME}/bin:/usr/bin.
+    # Most servers configure no env at all, so skip the loop outright.
     processed_env_vars = {}
-    for key, value in server.env.items():
-        if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-            # Extract variable name from ${VAR}
-            env_var_name = value[2:-1]
-            # Get actual value from environment
-            env_var_value = os.environ.get(env_var_name, "")
-            processed_env_vars[key] = env_var_value
-            print(f"Using environment variable for {key}")
+    if server.env:
+        if not any(isinstance(v, str) and "${" in v for v in server.env.values()):
+            # Fully static env (no ${ anywhere): a substring scan per
+            # value is much cheaper than a regex pass, and the copy
+            # keeps later per-server additions off the config's dict
+            processed_env_vars = dict(server.env)
         else:
-            processed_env_vars[key] = value
-    
-    # Auto-accept prompts to prevent hanging on update prompts
-    env["NPM_CONFIG_YES"] = "true"  # Auto-accept npm prompts
-    env["UV_NO_PROGRESS"] = "1"     # Disable uv progress bars
-    env["UV_QUIET"] = "1"           # Make uv quieter
-    
-    # Enable faster port reuse by setting environment variable
-    # This affects Python and Node.js socket behavior
-    env["NODE_OPTIONS"] = env.get("NODE_OPTIONS", "") + " --unhandled-rejections=strict"
-    # Set SO_REUSEADDR for Python servers
-    env["PYTHONUNBUFFERED"] = "1"  # Ensure unbuffered output
-    
+            for key, value in server.env.items():
+                if isinstance(value, str):
+                    expanded = _ENV_RE.sub(lambda m: os.environ.get(m.group(1), ""), value)
+                    if expanded != value:
+                        _vprint(f"Using environment variable for {key}")
+                    processed_env_vars[key] = expanded
+                else:
+                    processed_env_vars[key] = value
+
     # For Node/supergateway - enable faster socket release
     if server.server_type == "stdio" and use_supergateway:
         processed_env_vars["UV_SO_REUSEADDR"] = "1"  # libuv socket reuse option
         processed_env_vars["UV_TCP_SO_REUSEPORT"] = "1"  # Enable SO_REUSEPORT if available
-    
-    # Update environment with processed variables
-    env.update(processed_env_vars)
-    
+
+    # Overlay the server's own (expanded) variables onto the shared
+    # base snapshot — one small dict display per launch instead of a
+    # full environment copy plus mutations
+    env = {**_base_child_env(), **processed_env_vars}
+
     base_cmd = [server.command] + server.args
     
     # Only use supergateway if requested AND server is a stdio type
     if use_supergateway and server.server_type == "stdio":
-        # Modify the base command to auto-accept prompts for npx/uvx
-        if server.command == "npx":
+        # Modify the base command to auto-accept prompts for npx
+        # (uvx and everything else run non-interactively as configured)
+        if server.command == "npx" and "-y" not in server.args:
             # Ensure -y flag is present for auto-accept
-            modified_args = server.args[:]
-            if "-y" not in modified_args:
-                modified_args.insert(0, "-y")
-            cmd_str = f"{server.command} {' '.join(modified_args)}"
-        elif server.command == "uvx":
-            # uvx doesn't need special flags, it's non-interactive by default
-            cmd_str = f"{server.command} {' '.join(server.args)}"
+            cmd_str = shlex.join([server.command, "-y", *server.args])
         else:
-            cmd_str = f"{server.command} {' '.join(server.args)}"
-        
-        # Construct the supergateway command
-        cmd = ["npx", "-y", "supergateway", "--stdio", cmd_str]
+            cmd_str = server.cmd_str
+
+        # Construct the supergateway command, preferring a resolved
+        # binary over an npx round-trip
+        sgw = _find_supergateway()
+        launcher = [sgw] if sgw else ["npx", "-y", "supergateway"]
+        cmd = launcher + ["--stdio", cmd_str]
         if server.port:
             # Insert port argument before the stdio argument
-            cmd = ["npx", "-y", "supergateway", "--port", str(server.port), "--stdio", cmd_str]
+            cmd = launcher + ["--port", str(server.port), "--stdio", cmd_str]
     else:
         # Run the command directly without supergateway
         if server.command == "npx":
@@ -307,48 +1003,88 @@ def run_server(server: MCPServer, use_supergateway: bool = True, run_in_backgrou
         else:
             cmd = base_cmd
     
-    print(f"Starting {server.name}...")
-    print(f"Command: {' '.join(cmd)}")
+    _vprint(f"Starting {server.name}...")
+    if VERBOSE:
+        # Joining argv is itself throwaway work; skip it entirely when
+        # nobody is looking
+        print(f"Command: {' '.join(cmd)}")
     
     try:
         if run_in_background:
-            # Create log file
+            # Open the log as a raw fd: Popen only needs a descriptor, so
+            # this skips the buffered file object, and O_CLOEXEC keeps the
+            # fd from leaking into any other child we spawn (dup2 onto the
+            # child's stdout/stderr clears the flag where it matters)
             log_file_path = f"/tmp/{server.name}.log"
-            log_file = open(log_file_path, "w")
-            
-            # Run process in background
-            # Use start_new_session=True instead of preexec_fn for macOS compatibility
-            process = subprocess.Popen(
-                cmd,
-                env=env,
-                stdout=log_file,
-                stderr=log_file,
-                start_new_session=True,
-                # Ensure we can control process groups properly
-                close_fds=True,
+            log_fd = os.open(
+                log_file_path,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC | os.O_CLOEXEC,
+                0o644,
             )
-            
+
+            # Run process in background
+            try:
+                if hasattr(os, "posix_spawn"):
+                    # posix_spawn skips fork's page-table copy — the
+                    # manager's memory grows with every tracked server,
+                    # and fork pays for all of it per launch. file_actions
+                    # dup the log fd onto the child's stdout/stderr, and
+                    # setsid gives it its own process group just like
+                    # start_new_session would.
+                    pid = os.posix_spawn(
+                        _resolve_command(cmd[0]),
+                        cmd,
+                        env,
+                        file_actions=[
+                            (os.POSIX_SPAWN_DUP2, log_fd, 1),
+                            (os.POSIX_SPAWN_DUP2, log_fd, 2),
+                        ],
+                        setsid=True,
+                    )
+                    process = SpawnedProcess(pid)
+                else:
+                    # Use start_new_session=True instead of preexec_fn for
+                    # macOS compatibility
+                    process = subprocess.Popen(
+                        cmd,
+                        env=env,
+                        stdout=log_fd,
+                        stderr=log_fd,
+                        start_new_session=True,
+                        # Ensure we can control process groups properly
+                        close_fds=True,
+                    )
+            finally:
+                # The child holds its own copies now; the old buffered
+                # file object leaked one fd per launched server
+                os.close(log_fd)
+
             # Track this process for cleanup
             background_processes.append(process)
             
-            print(f"Server {server.name} launched in background with PID {process.pid}")
-            print(f"Logs are written to {log_file_path}")
-            
-            # Check if process exited immediately (indicating a failure)
-            # Give a short grace period for immediate crashes
-            time.sleep(0.5)
-            if process.poll() is not None:
-                print(f"ERROR: Server {server.name} exited immediately with code {process.returncode}")
-                print(f"Check logs at {log_file_path}")
-                return False
-            
-            print(f"Server {server.name} is running")
+            _record_server_pid(server.name, process.pid, log_file_path)
+
+            # One print per launch: under the thread-pool burst every
+            # print() serializes on the stdout lock
+            print(f"Server {server.name} launched in background with PID {process.pid}\n"
+                  f"Logs are written to {log_file_path}")
             
-            # If it's a stdio server with supergateway, print the connection URL
-            if use_supergateway and server.server_type == "stdio":
-                port = server.port if server.port else 8000
-                print(f"Connect to SSE endpoint: http://localhost:{port}/sse")
-                print(f"POST messages to: http://localhost:{port}/message")
+            # Check if process exited immediately (indicating a failure).
+            # When startup_grace is None the caller batches this check
+            # across servers (one shared sleep) via verify_server_started.
+            if startup_grace is not None:
+                if server.port:
+                    wait_for_port_listening(server.port, process)
+                else:
+                    # No port to probe; wait for first log output or an
+                    # early crash, whichever comes first
+                    _wait_for_first_output(process, log_file_path, startup_grace)
+                if not verify_server_started(server, process, use_supergateway):
+                    return False
+
+            # Return the process so batch callers can poll it later; it is
+            # truthy, so existing "if not success" checks still work
+            return process
         else:
             subprocess.run(cmd, env=env, check=True)
     except subprocess.CalledProcessError as e:
@@ -360,8 +1096,71 @@ def run_server(server: MCPServer, use_supergateway: bool = True, run_in_backgrou
     return True
 
 
+def start_servers_parallel(servers_to_start, use_supergateway, skip_update_check=False):
+    """Launch a batch of servers concurrently and verify them together.
+
+    Returns True when at least one server is up and worth supervising;
+    False means the caller must not park waiting for children that
+    were never launched.
+
+    The update checks run first, all at once, on a single event loop;
+    the spawns then fan out over a thread pool — fork+exec releases the
+    GIL, so the batch takes roughly as long as the slowest single
+    launch instead of their sum. Appends to background_processes are
+    atomic under the GIL, so the worker threads need no extra
+    locking."""
+    # Fail fast on duplicate ports before any fork — otherwise the
+    # second supergateway crashes late with a confusing bind error
+    seen_ports = {}
+    for server in servers_to_start:
+        if server.port:
+            first = seen_ports.setdefault(server.port, server.name)
+            if first != server.name:
+                print(f"ERROR: servers '{first}' and '{server.name}' are both configured for port {server.port}")
+                print("Fix the ports in the config before launching.")
+                return False
+
+    # Run every server's update check concurrently on one event loop
+    # before any launch; the launches themselves stay synchronous
+    if not skip_update_check:
+        for server, updated in zip(servers_to_start, check_and_update_servers(servers_to_start)):
+            if updated:
+                print(f"🔄 {server.name} was updated to the latest version")
+
+    # Pay the supergateway resolution (and, on a cold npx cache, the
+    # package download) once instead of once per launcher thread
+    if use_supergateway and any(s.server_type == "stdio" for s in servers_to_start):
+        _prewarm_supergateway()
+
+    print(f"Starting {len(servers_to_start)} servers in parallel...")
+    with ThreadPoolExecutor(max_workers=min(16, len(servers_to_start))) as executor:
+        procs = list(executor.map(
+            lambda server: run_server(server, use_supergateway, True,
+                                      startup_grace=None, skip_update_check=True),
+            servers_to_start))
+
+    started = []
+    for server, process in zip(servers_to_start, procs):
+        if not process:
+            print(f"Failed to start server: {server.name}")
+        else:
+            started.append((server, process))
+
+    # One shared grace period covers the whole batch, ending early if
+    # any child exits
+    if started:
+        _wait_for_early_crash([process for _, process in started])
+        for server, process in started:
+            if not verify_server_started(server, process, use_supergateway):
+                print(f"Failed to start server: {server.name}")
+
+    return bool(started)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Configure and run MCP servers with supergateway")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="Print per-server progress detail (also MCP_VERBOSE=1)")
     subparsers = parser.add_subparsers(dest="command", help="Commands")
     
     # Add server command
@@ -385,13 +1184,19 @@ def main():
     run_parser.add_argument("--no-supergateway", action="store_true", help="Run without supergateway")
     run_parser.add_argument("--no-background", action="store_true", help="Don't run servers in background")
     run_parser.add_argument("--sequential", action="store_true", help="Run servers sequentially with the last one in foreground (legacy behavior)")
+    run_parser.add_argument("--no-update", action="store_true", help="Skip update checks before starting servers")
+    run_parser.add_argument("--update-interval-hours", type=float, default=24,
+                            help="Check for updates at most once per this many hours (default: 24)")
     run_parser.add_argument("--config", default="mcp_config.json", help="Configuration file")
-    
+
     # Run all servers command
     run_all_parser = subparsers.add_parser("run-all", help="Run all configured MCP servers")
     run_all_parser.add_argument("--no-supergateway", action="store_true", help="Run without supergateway")
     run_all_parser.add_argument("--no-background", action="store_true", help="Don't run servers in background")
     run_all_parser.add_argument("--sequential", action="store_true", help="Run servers sequentially with the last one in foreground (legacy behavior)")
+    run_all_parser.add_argument("--no-update", action="store_true", help="Skip update checks before starting servers")
+    run_all_parser.add_argument("--update-interval-hours", type=float, default=24,
+                                help="Check for updates at most once per this many hours (default: 24)")
     run_all_parser.add_argument("--config", default="mcp_config.json", help="Configuration file")
     
     # Remove server command
@@ -403,7 +1208,13 @@ def main():
     stop_parser = subparsers.add_parser("stop", help="Stop all background servers")
     
     args = parser.parse_args()
-    
+
+    # The flag and the env var both feed the same module-level gate that
+    # _vprint and the hot-path "Command:" join check
+    if args.verbose:
+        global VERBOSE
+        VERBOSE = True
+
     if not args.command:
         parser.print_help()
         return
@@ -424,8 +1235,9 @@ def main():
         except FileNotFoundError:
             servers = []
         
-        # Check if server with the same name already exists
-        if any(server.name == args.name for server in servers):
+        # Check if server with the same name already exists (hashed
+        # membership instead of a linear scan)
+        if args.name in {server.name for server in servers}:
             print(f"Server with name '{args.name}' already exists")
             return
         
@@ -451,7 +1263,7 @@ def main():
             
             for i, server in enumerate(servers):
                 print(f"{i+1}. {server.name}")
-                print(f"   Command: {server.command} {' '.join(server.args)}")
+                print(f"   Command: {server.cmd_str}")
                 print(f"   Server type: {server.server_type}")  # Display server type in list output
                 if server.env:
                     print(f"   Environment variables: {server.env}")
@@ -462,51 +1274,62 @@ def main():
             print(f"Config file {args.config} does not exist")
     
     elif args.command == "run":
-        servers = load_config(args.config)
-        # Find all requested servers
         servers_to_run = []
         missing_servers = []
-        
-        for name in args.names:
-            server = next((s for s in servers if s.name == name), None)
+
+        if len(args.names) == 1:
+            # Single-server run (the common child invocation from the
+            # launcher): build just the one record instead of
+            # materializing every MCPServer in the config
+            server = load_one(args.config, args.names[0])
             if server:
                 servers_to_run.append(server)
             else:
-                missing_servers.append(name)
+                missing_servers.append(args.names[0])
+        else:
+            # Find all requested servers via one name -> server index
+            # instead of rescanning the list per requested name
+            server_by_name = {s.name: s for s in load_config(args.config)}
+            for name in args.names:
+                server = server_by_name.get(name)
+                if server:
+                    servers_to_run.append(server)
+                else:
+                    missing_servers.append(name)
         
         if missing_servers:
             print(f"The following servers were not found: {', '.join(missing_servers)}")
             if not servers_to_run:
                 return
-        
+
+        # Probe for updates at most once per interval (or never with
+        # --no-update); hot-path restarts then skip the npm/git phase
+        skip_updates = not _updates_due(args.no_update, args.update_interval_hours)
+
         # Determine how to run servers
         if args.sequential:
             # Run servers sequentially with the last one in foreground
             run_in_background = len(servers_to_run) > 1 and not args.no_background
-            
+
             for i, server in enumerate(servers_to_run):
                 # Don't run the last server in background
                 is_last_server = i == len(servers_to_run) - 1
                 background = run_in_background and not is_last_server
-                success = run_server(server, not args.no_supergateway, background)
+                success = run_server(server, not args.no_supergateway, background,
+                                     skip_update_check=skip_updates)
                 if not success:
                     break
         else:
-            # Run all servers in parallel (all in background)
-            print(f"Starting {len(servers_to_run)} servers in parallel...")
-            for server in servers_to_run:
-                success = run_server(server, not args.no_supergateway, True)  # Always run in background
-                if not success:
-                    print(f"Failed to start server: {server.name}")
-            
+            # Run all servers in parallel (all in background); don't
+            # park waiting for children that were never launched
+            if not start_servers_parallel(servers_to_run, not args.no_supergateway, skip_updates):
+                sys.exit(1)
+
             # Keep the main process running to handle signals
-            try:
-                print("All servers started. Press Ctrl+C to stop all servers.")
-                while True:
-                    time.sleep(1)
-            except KeyboardInterrupt:
-                print("\nStopping all servers...")
-                cleanup_background_processes(force_kill=True)  # Use force kill for faster termination
+            print("All servers started. Press Ctrl+C to stop all servers.")
+            _wait_for_shutdown()
+            print("\nStopping all servers...")
+            cleanup_background_processes(force_kill=True)  # Use force kill for faster termination
     
     elif args.command == "run-all":
         servers = load_config(args.config)
@@ -514,70 +1337,75 @@ def main():
         if not servers:
             print("No MCP servers configured")
             return
-        
+
+        skip_updates = not _updates_due(args.no_update, args.update_interval_hours)
+
         # Determine how to run servers
         if args.sequential:
             # Run servers sequentially with the last one in foreground
             run_in_background = len(servers) > 1 and not args.no_background
-            
+
             for i, server in enumerate(servers):
                 # Don't run the last server in background
                 is_last_server = i == len(servers) - 1
                 background = run_in_background and not is_last_server
-                success = run_server(server, not args.no_supergateway, background)
+                success = run_server(server, not args.no_supergateway, background,
+                                     skip_update_check=skip_updates)
                 if not success:
                     break
         else:
-            # Run all servers in parallel (all in background)
-            print(f"Starting {len(servers)} servers in parallel...")
-            for server in servers:
-                success = run_server(server, not args.no_supergateway, True)  # Always run in background
-                if not success:
-                    print(f"Failed to start server: {server.name}")
-            
+            # Run all servers in parallel (all in background); don't
+            # park waiting for children that were never launched
+            if not start_servers_parallel(servers, not args.no_supergateway, skip_updates):
+                sys.exit(1)
+
             # Keep the main process running to handle signals
-            try:
-                print("All servers started. Press Ctrl+C to stop all servers.")
-                while True:
-                    time.sleep(1)
-            except KeyboardInterrupt:
-                print("\nStopping all servers...")
-                cleanup_background_processes(force_kill=True)  # Use force kill for faster termination
+            print("All servers started. Press Ctrl+C to stop all servers.")
+            _wait_for_shutdown()
+            print("\nStopping all servers...")
+            cleanup_background_processes(force_kill=True)  # Use force kill for faster termination
     
     elif args.command == "remove":
-        servers = load_config(args.config)
-        
-        before_count = len(servers)
-        servers = [s for s in servers if s.name != args.name]
-        
-        if len(servers) == before_count:
+        # One name -> server index serves both the existence check and
+        # the removal; dicts preserve insertion order, so the saved
+        # config keeps its server ordering
+        servers_by_name = {s.name: s for s in load_config(args.config)}
+
+        if servers_by_name.pop(args.name, None) is None:
             print(f"Server with name '{args.name}' not found")
             return
-        
-        save_config(args.config, servers)
+
+        save_config(args.config, list(servers_by_name.values()))
         print(f"Removed MCP server: {args.name}")
     
     elif args.command == "stop":
         cleanup_background_processes(force_kill=True)
-        
+
+        # Stop servers launched by previous invocations via the PID file
+        if stop_recorded_servers():
+            print("Stopped recorded background servers")
+
         # Additionally check for any lingering processes using server ports
         # Useful for cases where our subprocess tracking might have missed something
         try:
+            # Import once, outside the loop; each port then costs a
+            # single in-process bind probe instead of a subprocess chain
+            from check_server_port import check_server_port, is_port_free
+
             servers = load_config("mcp_config.json")
             for server in servers:
                 if server.port:
                     print(f"Checking if port {server.port} is still in use...")
-                    # Import the function to check ports directly
-                    try:
-                        # First try to import from check_server_port module
-                        from check_server_port import check_port_in_use, check_server_port
-                        conflicts = check_port_in_use(server.port)
-                        if conflicts:
-                            print(f"Port {server.port} is still in use by:")
-                            # Use check_server_port with force flag for faster termination
-                            check_server_port(server.port, kill_conflicts=True, force=True)
-                    except ImportError:
-                        print("Unable to import check_port_in_use function")
+                    # A successful bind proves the port is already free
+                    # (the common case right after cleanup) without ever
+                    # forking lsof or walking /proc
+                    if is_port_free(server.port):
+                        continue
+                    print(f"Port {server.port} is still in use:")
+                    # Use check_server_port with force flag for faster termination
+                    check_server_port(server.port, kill_conflicts=True, force=True)
+        except ImportError:
+            print("Unable to import check_server_port module")
         except Exception as e:
             print(f"Error checking for lingering port processes: {e}")
         